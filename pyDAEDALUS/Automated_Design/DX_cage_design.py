@@ -58,9 +58,9 @@ def DX_cage_design(coordinates, edges, faces, edge_length_vec, file_name,
         0 if double crossover vertex staples should be used.
     scaf_seq :
         string containing the sequence of the scaffold. If using default,
-        input [].
+        input None.
     scaf_name :
-        string containing the name of the scaffold. If using default, input [].
+        string containing the name of the scaffold. If using default, input None.
 
     Returns
     -------
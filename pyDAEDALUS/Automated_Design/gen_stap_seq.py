@@ -1,6 +1,10 @@
 import numpy as np
 
 
+# Staple base paired with each scaffold base (U in case user inputs RNA seq)
+COMPLEMENT = {'A': 'T', 'T': 'A', 'G': 'C', 'C': 'G', 'U': 'A'}
+
+
 def gen_stap_seq(staples, scaf_seq, staple_name, scaf_name,
                  len_scaf_used):
     """
@@ -48,23 +52,18 @@ def gen_stap_seq(staples, scaf_seq, staple_name, scaf_name,
         staps_for_this_edge = []
         for stap_ID in range(len(staples[edge_ID])):
             stap = staples[edge_ID][stap_ID]  # obtain staple index information
-            seq = u''  # initialize string
+            seq_letters = []
             for nt_ID in stap:
                 # # because A binds to T, and G binds to C...
-                if (nt_ID is None) or (scaf_seq[nt_ID] == 'A'):
-                    seq += 'T'
-                elif scaf_seq[nt_ID] == 'T':
-                    seq += 'A'
-                elif scaf_seq[nt_ID] == 'G':
-                    seq += 'C'
-                elif scaf_seq[nt_ID] == 'C':
-                    seq += 'G'
-                elif scaf_seq[nt_ID] == 'U': # in case user inputs RNA seq
-                    seq += 'A'
+                if nt_ID is None:
+                    seq_letters.append('T')
                 else:
-                    # Error -- unrecognized nucleotide in scaffold sequence
-                    assert False, 'Unrecognized nucleotide in scaffold sequence'
-                
+                    nt = scaf_seq[nt_ID]
+                    assert nt in COMPLEMENT, \
+                        'Unrecognized nucleotide in scaffold sequence'
+                    seq_letters.append(COMPLEMENT[nt])
+            seq = u''.join(seq_letters)
+
             staps_for_this_edge.append(seq)
 
             if seq:  # if seq exists (may have been blank)
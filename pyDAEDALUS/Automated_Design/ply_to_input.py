@@ -1,31 +1,85 @@
+import io
 from os import path
 import numpy as np
 
 from matplotlib import pyplot as plt
 
 
+# numpy type codes of the scalar types allowed in a PLY header
+PLY_TO_NUMPY_TYPE = {
+    'char': 'i1', 'int8': 'i1', 'uchar': 'u1', 'uint8': 'u1',
+    'short': 'i2', 'int16': 'i2', 'ushort': 'u2', 'uint16': 'u2',
+    'int': 'i4', 'int32': 'i4', 'uint': 'u4', 'uint32': 'u4',
+    'float': 'f4', 'float32': 'f4', 'double': 'f8', 'float64': 'f8',
+}
+PLY_BYTE_ORDER = {'binary_little_endian': '<', 'binary_big_endian': '>'}
+
+
 def extract_file_reader_and_shape_name_from_input_filename(input_filename):
     if input_filename[-4:] == '.ply':
         fname_no_ply = input_filename[:-4]
         full_filename = input_filename
+    elif path.isfile(input_filename):
+        # PLY content is self-describing, so accept other extensions as given
+        fname_no_ply = path.splitext(input_filename)[0]
+        full_filename = input_filename
     else:
         fname_no_ply = input_filename
         full_filename = input_filename + '.ply'
     assert path.isfile(full_filename)
 
-    f = open(full_filename)
+    f = open(full_filename, 'rb')
     shape_name = path.basename(path.normpath(fname_no_ply))
     return f, shape_name
 
 
-def ply_to_input(input_filename, results_foldername=None, min_len_nt=31, Aform=False):
+def read_ply_header(filestream):
+    """
+    Parse the header of a PLY file opened in binary mode.
+
+    Leaves `filestream` positioned at the first byte of the body.
+
+    Returns
+    -------
+    ply_format
+        'ascii', 'binary_little_endian' or 'binary_big_endian'
+    elements
+        List of (name, count, properties) tuples in file order.  Each property
+        is the tuple of its PLY type names: (type,) for a scalar property and
+        ('list', count_type, item_type) for a list property.
+    """
+    ply_format = None
+    elements = []
+    while True:
+        line = filestream.readline()
+        assert line, 'PLY header has no end_header line'
+        # Only the ASCII keywords matter; latin-1 lets comment and obj_info
+        # lines carry any other bytes
+        words = line.decode('latin-1').split()
+        if not words:
+            continue
+        if words[0] == 'end_header':
+            break
+        if words[0] == 'format':
+            ply_format = words[1]
+        elif words[0] == 'element':
+            elements.append((words[1], int(words[2]), []))
+        elif words[0] == 'property':
+            elements[-1][2].append(tuple(words[1:-1]))
+
+    return ply_format, elements
+
+
+def ply_to_input(input_filename, results_foldername=None, min_len_nt=31, Aform=False,
+                 header=None):
     """
 
     Converts PLY file into design variables for DX_cage_design input.
 
     This function parses the ply-formatted file pointed to by the given
-    `input_filename`.  First, it directly reads in all shape data.  Second,
-    it parses out some meta-variables to be used for scaffold creaction.
+    `input_filename` (ASCII or binary PLY).  First, it directly reads in all
+    shape data.  Second, it parses out some meta-variables to be used for
+    scaffold creaction.
     Optionally, it also creates plots for edge length distributions.
 
     Parameters
@@ -41,6 +95,10 @@ def ply_to_input(input_filename, results_foldername=None, min_len_nt=31, Aform=F
         The number of nucleotides long the smallest edge will have. Each edge
         must be a multiple of 11 bp, min 33 bp (A-form) or 10.5 bp, min 31 bp
         (B-form).
+    header : tuple, optional
+        (ply_format, elements, body_offset) for this file, as already read by
+        the caller with `read_ply_header`.  When given, the header is skipped
+        instead of being parsed again.
 
     Returns
     -------
@@ -68,80 +126,95 @@ def ply_to_input(input_filename, results_foldername=None, min_len_nt=31, Aform=F
     f, shape_name = extract_file_reader_and_shape_name_from_input_filename(
         input_filename)
 
-    def extract_number_from_keyword_in_ply_file(filestream, keyword):
-        # Eat (read through) all lines up to and including line with `keyword`:
-        line = ''
-        while keyword not in line:
-            line = filestream.readline()
-
-        # grab last whitespace-delimited bit from line and convert to int:
-        number = int(line.strip().split()[-1])
-
-        return number
+    with f:
+        if header is None:
+            ply_format, elements = read_ply_header(f)
+        else:
+            ply_format, elements, body_offset = header
+            f.seek(body_offset)
+        body = f.read()
 
-    num_vert = extract_number_from_keyword_in_ply_file(f, 'element vertex')
-    num_faces = extract_number_from_keyword_in_ply_file(f, 'element face')
+    # The body lists all vertices, then all faces:
+    assert [name for name, _, _ in elements[:2]] == ['vertex', 'face']
+    (_, num_vert, vertex_properties), (_, num_faces, face_properties) = \
+        elements[:2]
 
-    def extract_coordinates_from_file(filestream, number_of_vertices):
-        # read lines up to and including the one containing 'end header':
-        temp = ''
-        while 'end_header' not in temp:  # not strict equality, because
-            temp = filestream.readline()
+    def extract_ascii_coordinates_and_faces(body, number_of_vertices,
+                                            number_of_faces):
+        lines = body.decode('latin-1').splitlines()
 
-        coordinates_as_list = []
-        for i in range(number_of_vertices):
-            line = filestream.readline()
-            line_as_list = line.split()
-            coords_on_this_line = list(map(float, line_as_list))
-            coordinates_as_list.append(coords_on_this_line)
-
-        return coordinates_as_list
-
-    coordinates = extract_coordinates_from_file(f, num_vert)
-
-    def extract_faces_from_file(filestream, number_of_faces):
+        # one vectorized parse for the whole vertex block:
+        coordinates = np.loadtxt(
+            io.StringIO(u'\n'.join(lines[:number_of_vertices])), ndmin=2)
 
         faces_as_list = []
-        for face_id in range(number_of_faces):
-            line = filestream.readline()
-            line_as_list_of_ints = list(map(int, line.strip().split()))
-            number_of_vertices = line_as_list_of_ints[0]
+        for line in lines[number_of_vertices:
+                          number_of_vertices + number_of_faces]:
+            line_as_list_of_ints = list(map(int, line.split()))
+            number_of_vertices_in_face = line_as_list_of_ints[0]
             vertices = line_as_list_of_ints[1:]
 
-            assert number_of_vertices == len(vertices)
+            assert number_of_vertices_in_face == len(vertices)
             faces_as_list.append(vertices)
 
-        return faces_as_list
+        return coordinates, faces_as_list
+
+    def extract_binary_coordinates_and_faces(body, byte_order,
+                                             number_of_vertices,
+                                             number_of_faces):
+        # The vertex block is a fixed-size record per vertex:
+        vertex_dtype = np.dtype([
+            ('p{}'.format(i), byte_order + PLY_TO_NUMPY_TYPE[prop[0]])
+            for i, prop in enumerate(vertex_properties)])
+        vertices = np.frombuffer(body, dtype=vertex_dtype,
+                                 count=number_of_vertices)
+        coordinates = np.column_stack(
+            [vertices[name] for name in vertex_dtype.names]).astype(float)
+
+        # Face records hold a variable-length list, so walk them in order:
+        offset = vertex_dtype.itemsize * number_of_vertices
+        faces_as_list = []
+        for face_id in range(number_of_faces):
+            for prop in face_properties:
+                if prop[0] == 'list':
+                    count_type = np.dtype(byte_order + PLY_TO_NUMPY_TYPE[prop[1]])
+                    item_type = np.dtype(byte_order + PLY_TO_NUMPY_TYPE[prop[2]])
+                    number_of_vertices_in_face = int(
+                        np.frombuffer(body, count_type, 1, offset)[0])
+                    offset += count_type.itemsize
+                    faces_as_list.append(np.frombuffer(
+                        body, item_type, number_of_vertices_in_face,
+                        offset).tolist())
+                    offset += item_type.itemsize * number_of_vertices_in_face
+                else:
+                    offset += np.dtype(PLY_TO_NUMPY_TYPE[prop[0]]).itemsize
+
+        return coordinates, faces_as_list
 
-    faces = extract_faces_from_file(f, num_faces)
+    if ply_format == 'ascii':
+        coordinates, faces = extract_ascii_coordinates_and_faces(
+            body, num_vert, num_faces)
+    else:
+        assert ply_format in PLY_BYTE_ORDER, \
+            'Unknown PLY format {}'.format(ply_format)
+        coordinates, faces = extract_binary_coordinates_and_faces(
+            body, PLY_BYTE_ORDER[ply_format], num_vert, num_faces)
 
     def remove_unused_vertices(coordinates, faces, number_of_vertices):
-        # Determine if you need to clean the vertex indices:
-        used_face_ids_as_list = []
-        for vertices in faces:
-            used_face_ids_as_list += vertices
-        unique_used_faces_as_set = set(used_face_ids_as_list)
-        # sort to enforce consistency:
-        unique_used_faces_as_list = sorted(list(unique_used_faces_as_set))
-        cleaning_needed = len(unique_used_faces_as_set) < number_of_vertices
+        # Determine if you need to clean the vertex indices
+        # (sort to enforce consistency):
+        unique_used_vertices = sorted(
+            set(vertex for vertices in faces for vertex in vertices))
+        cleaning_needed = len(unique_used_vertices) < number_of_vertices
 
         # Then clean if needed:
         if cleaning_needed:
-            # Remove unused row from coordinates data.
-            new_coordinates = []
-            for i, row in enumerate(coordinates):
-                if i in unique_used_faces_as_set:
-                    new_coordinates.append(row)
-            coordinates = new_coordinates
-
-            new_faces = []
-            for current_vertices in faces:
-                new_vertices = []
-                for vertex in current_vertices:
-                    new_vertex = unique_used_faces_as_list.index(vertex)
-                    new_vertices.append(new_vertex)
-                new_faces.append(new_vertices)
-            faces = new_faces
+            # Remove unused rows from coordinates data and renumber faces.
+            coordinates = coordinates[unique_used_vertices]
+            new_index = {old: new
+                         for new, old in enumerate(unique_used_vertices)}
+            faces = [[new_index[vertex] for vertex in vertices]
+                     for vertices in faces]
 
         return coordinates, faces
 
@@ -160,13 +233,8 @@ def ply_to_input(input_filename, results_foldername=None, min_len_nt=31, Aform=F
     edges = get_edges_from_faces(faces)
 
     def get_edge_lengths(edges, coordinates):
-        edge_length_vec = []
-        for edge in edges:
-            beginning, end = edge
-            length = np.linalg.norm(np.array(coordinates[beginning]) -
-                                    np.array(coordinates[end]))
-            edge_length_vec.append(length)
-        return edge_length_vec
+        return np.linalg.norm(coordinates[edges[:, 0]] -
+                              coordinates[edges[:, 1]], axis=1)
 
     edge_length_PLY = get_edge_lengths(edges, coordinates)
 
@@ -4,7 +4,6 @@ pyDAEDALUS - Python DAEDALUS for nucleic acid-scaffolded wireframe origami desig
 A Python package for designing DNA/RNA origami structures from 3D geometric inputs.
 """
 
-from .pydaedalus import design_structure, design_dna_structure, design_rna_structure, DesignResult
 from .exceptions import (
     PyDAEDALUSError, GeometryFileError, ScaffoldSequenceError, 
     HelicalParameterError, DesignConstraintError, StapleGenerationError, 
@@ -16,6 +15,7 @@ __author__ = "Sakul Ratanalert, Tyson Shepherd"
 
 __all__ = [
     "design_structure",
+    "design_structures",
     "design_dna_structure", 
     "design_rna_structure",
     "DesignResult",
@@ -27,4 +27,23 @@ __all__ = [
     "DesignConstraintError", 
     "StapleGenerationError",
     "OutputDirectoryError"
-]
\ No newline at end of file
+]
+
+# The design entry points pull in the whole Automated_Design pipeline (NumPy,
+# SciPy, matplotlib, networkx), so they are imported on first access only.
+_LAZY_ATTRIBUTES = frozenset({
+    "design_structure",
+    "design_structures",
+    "design_dna_structure",
+    "design_rna_structure",
+    "DesignResult",
+})
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        from . import pydaedalus as _pydaedalus
+        value = getattr(_pydaedalus, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,43 +2,72 @@
 Custom exceptions for pyDAEDALUS with detailed error messages and troubleshooting guidance.
 """
 
+import copyreg
+import mmap
 import os
+import warnings
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
+
+
+_VALID_BASES = frozenset('ATGCUatgcu')
+_VALID_UPPER_BASES = frozenset('ATGCU')
+
+# Scaffold files are validated in chunks of this many bytes
+_SCAN_CHUNK_SIZE = 1 << 20
+_WHITESPACE = b' \t\n\r\x0b\x0c'
+
+# Cap on the alternative PLY files listed when a geometry file is missing
+_MAX_PLY_SUGGESTIONS = 20
 
 
 class PyDAEDALUSError(Exception):
     """Base exception class for pyDAEDALUS with enhanced error reporting."""
     
-    def __init__(self, message: str, technical_details: str = "", suggestions: List[str] = None):
+    def __init__(self, message: str, technical_details: str = "", suggestions: Sequence[str] = None):
         self.message = message
         self.technical_details = technical_details
-        self.suggestions = suggestions or []
-        
-        # Build comprehensive error message
-        full_message = f"{message}"
-        
-        if technical_details:
-            full_message += f"\n\nTechnical Details:\n{technical_details}"
-        
-        if self.suggestions:
-            full_message += f"\n\nSuggestions to fix this:"
-            for i, suggestion in enumerate(self.suggestions, 1):
-                full_message += f"\n  {i}. {suggestion}"
-        
-        super().__init__(full_message)
+        self.suggestions = suggestions or ()
+
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        # Build comprehensive error message on first use only
+        full_message = self.__dict__.get('_full_message')
+        if full_message is None:
+            full_message = self.message
+
+            if self.technical_details:
+                full_message += f"\n\nTechnical Details:\n{self.technical_details}"
+
+            if self.suggestions:
+                full_message += "\n\nSuggestions to fix this:\n" + "\n".join(
+                    f"  {i}. {suggestion}" for i, suggestion in enumerate(self.suggestions, 1)
+                )
+
+            self._full_message = full_message
+        return full_message
+
+    def __reduce__(self):
+        # Subclass constructors take different arguments, so rebuild from the
+        # instance state; errors raised in worker processes must unpickle
+        return copyreg.__newobj__, (type(self), self.message), self.__dict__
 
 
 class GeometryFileError(PyDAEDALUSError):
     """Raised when there are issues with geometry file input."""
     
+    _STATIC_SUGGESTIONS = (
+        "Verify the file is in PLY format (see https://en.wikipedia.org/wiki/PLY_(file_format))",
+        "Try opening the PLY file in a 3D viewer (like MeshLab) to verify it's valid",
+        "Check the example PLY files in the repository for reference format"
+    )
+    
     def __init__(self, filename: str, issue: str, technical_details: str = ""):
-        suggestions = [
+        suggestions = (
             f"Check that the file '{filename}' exists and is readable",
-            "Verify the file is in PLY format (see https://en.wikipedia.org/wiki/PLY_(file_format))",
-            "Try opening the PLY file in a 3D viewer (like MeshLab) to verify it's valid",
-            "Check the example PLY files in the repository for reference format"
-        ]
+        ) + self._STATIC_SUGGESTIONS
         
         message = f"Problem with geometry file '{filename}': {issue}"
         super().__init__(message, technical_details, suggestions)
@@ -47,91 +76,103 @@ class GeometryFileError(PyDAEDALUSError):
 class ScaffoldSequenceError(PyDAEDALUSError):
     """Raised when there are issues with scaffold sequence input."""
     
+    _STATIC_SUGGESTIONS = (
+        "Check that scaffold sequence file exists and contains valid nucleotides (A, T, G, C, U)",
+        "Verify sequence length is sufficient for your geometry (typically 2x total edge length)",
+        "Use 'M13.txt' or None to use default M13 scaffold sequence",
+        "For large designs, pyDAEDALUS will generate random sequence automatically"
+    )
+    
     def __init__(self, issue: str, sequence_info: str = "", technical_details: str = ""):
-        suggestions = [
-            "Check that scaffold sequence file exists and contains valid nucleotides (A, T, G, C, U)",
-            "Verify sequence length is sufficient for your geometry (typically 2x total edge length)",
-            "Use 'M13.txt' or None to use default M13 scaffold sequence",
-            "For large designs, pyDAEDALUS will generate random sequence automatically"
-        ]
-        
         message = f"Scaffold sequence problem: {issue}"
         if sequence_info:
             message += f" ({sequence_info})"
             
-        super().__init__(message, technical_details, suggestions)
+        super().__init__(message, technical_details, self._STATIC_SUGGESTIONS)
 
 
 class HelicalParameterError(PyDAEDALUSError):
     """Raised when helical form parameters are invalid."""
     
+    _STATIC_SUGGESTIONS = (
+        f"A-form (RNA): minimum 4 turns, 11 bp/turn → {4*11} bp minimum edge",
+        f"B-form (DNA): minimum 3 turns, 10.5 bp/turn → {int(3*10.5)} bp minimum edge",
+        "Consider using longer edges or switching helical form",
+        "Check that your geometry has sufficiently long edges for the chosen parameters"
+    )
+    _SUGGESTION_TEMPLATE = "Use at least {min_required} helical turns for {helical_form}"
+    _MESSAGE_TEMPLATE = ("Invalid helical parameters: {helical_form} with {helical_turns} turns "
+                         "(minimum {min_required} required)")
+    _DETAILS_TEMPLATE = (
+        "Helical form '{helical_form}' requires minimum {min_required} helical turns. "
+        "This ensures sufficient nucleotides for proper crossover formation and "
+        "structural stability."
+    )
+    
     def __init__(self, helical_form: str, helical_turns: int, min_required: int):
-        suggestions = [
-            f"Use at least {min_required} helical turns for {helical_form}",
-            f"A-form (RNA): minimum 4 turns, 11 bp/turn → {4*11} bp minimum edge",
-            f"B-form (DNA): minimum 3 turns, 10.5 bp/turn → {int(3*10.5)} bp minimum edge",
-            "Consider using longer edges or switching helical form",
-            "Check that your geometry has sufficiently long edges for the chosen parameters"
-        ]
-        
-        message = (f"Invalid helical parameters: {helical_form} with {helical_turns} turns "
-                  f"(minimum {min_required} required)")
+        params = {
+            "helical_form": helical_form,
+            "helical_turns": helical_turns,
+            "min_required": min_required
+        }
+        suggestions = (self._SUGGESTION_TEMPLATE.format_map(params),) + self._STATIC_SUGGESTIONS
         
-        technical_details = (
-            f"Helical form '{helical_form}' requires minimum {min_required} helical turns. "
-            f"This ensures sufficient nucleotides for proper crossover formation and "
-            f"structural stability."
+        super().__init__(
+            self._MESSAGE_TEMPLATE.format_map(params),
+            self._DETAILS_TEMPLATE.format_map(params),
+            suggestions
         )
-        
-        super().__init__(message, technical_details, suggestions)
 
 
 class DesignConstraintError(PyDAEDALUSError):
     """Raised when design constraints cannot be satisfied."""
     
+    _STATIC_SUGGESTIONS = (
+        "Try increasing the number of helical turns per edge",
+        "Use a simpler geometry with fewer faces or shorter edges",
+        "Check that the geometry is a valid 3D polyhedron",
+        "Verify the PLY file defines a closed, manifold surface",
+        "Consider using B-form instead of A-form for more flexibility"
+    )
+    
     def __init__(self, constraint: str, geometry_info: str = "", technical_details: str = ""):
-        suggestions = [
-            "Try increasing the number of helical turns per edge",
-            "Use a simpler geometry with fewer faces or shorter edges",
-            "Check that the geometry is a valid 3D polyhedron",
-            "Verify the PLY file defines a closed, manifold surface",
-            "Consider using B-form instead of A-form for more flexibility"
-        ]
-        
         message = f"Design constraint violation: {constraint}"
         if geometry_info:
             message += f"\nGeometry: {geometry_info}"
             
-        super().__init__(message, technical_details, suggestions)
+        super().__init__(message, technical_details, self._STATIC_SUGGESTIONS)
 
 
 class StapleGenerationError(PyDAEDALUSError):
     """Raised when staple sequence generation fails."""
     
+    _STATIC_SUGGESTIONS = (
+        "Check that scaffold sequence is long enough for the design",
+        "Verify geometry has reasonable edge length distribution", 
+        "Try using double crossover staples instead of single crossover",
+        "Use a different scaffold sequence or let pyDAEDALUS generate one",
+        "Simplify the geometry to reduce design complexity"
+    )
+    
     def __init__(self, stage: str, technical_details: str = ""):
-        suggestions = [
-            "Check that scaffold sequence is long enough for the design",
-            "Verify geometry has reasonable edge length distribution", 
-            "Try using double crossover staples instead of single crossover",
-            "Use a different scaffold sequence or let pyDAEDALUS generate one",
-            "Simplify the geometry to reduce design complexity"
-        ]
-        
         message = f"Staple generation failed at stage: {stage}"
-        super().__init__(message, technical_details, suggestions)
+        super().__init__(message, technical_details, self._STATIC_SUGGESTIONS)
 
 
 class OutputDirectoryError(PyDAEDALUSError):
     """Raised when output directory cannot be created or accessed."""
     
+    _STATIC_SUGGESTIONS = (
+        "Verify the parent directory exists",
+        "Try using a different output directory",
+        "Check available disk space",
+        "Ensure the path doesn't contain invalid characters"
+    )
+    
     def __init__(self, directory: str, issue: str):
-        suggestions = [
+        suggestions = (
             f"Check that you have write permissions for '{directory}'",
-            "Verify the parent directory exists",
-            "Try using a different output directory",
-            "Check available disk space",
-            "Ensure the path doesn't contain invalid characters"
-        ]
+        ) + self._STATIC_SUGGESTIONS
         
         message = f"Output directory problem: {issue}"
         technical_details = f"Cannot access or create directory: {directory}"
@@ -140,62 +181,252 @@ class OutputDirectoryError(PyDAEDALUSError):
 
 def validate_geometry_file(geometry_file: Path) -> None:
     """Validate geometry file with detailed error reporting."""
-    if not geometry_file.exists():
-        # Check for common mistakes
+    path_str = str(geometry_file)
+
+    # A single stat answers existence and emptiness; a single pread the magic
+    try:
+        st = os.stat(path_str)
+    except PermissionError:
+        raise GeometryFileError(
+            filename=path_str,
+            issue="Permission denied",
+            technical_details="Cannot read file due to permission restrictions"
+        )
+    except (OSError, ValueError) as e:
+        # Missing files, but also unusable paths (embedded NUL, symlink loops,
+        # names too long): none of them can be read as geometry
         potential_files = []
         parent_dir = geometry_file.parent
-        if parent_dir.exists():
-            for f in parent_dir.iterdir():
-                if f.suffix.lower() == '.ply':
-                    potential_files.append(f.name)
+        if parent_dir.is_dir():
+            with os.scandir(parent_dir) as entries:
+                potential_files = [entry.name for entry in entries if entry.name.lower().endswith('.ply')]
+            potential_files = potential_files[:_MAX_PLY_SUGGESTIONS]
         
         technical_details = f"File path: {geometry_file.absolute()}"
+        if not isinstance(e, (FileNotFoundError, NotADirectoryError)):
+            technical_details += f"\nReason: {getattr(e, 'strerror', None) or e}"
         if potential_files:
             technical_details += f"\n\nFound these PLY files in {parent_dir}:\n" + "\n".join(f"  - {f}" for f in potential_files)
         
         raise GeometryFileError(
-            filename=str(geometry_file),
+            filename=path_str,
             issue="File not found",
             technical_details=technical_details
         )
     
-    if not geometry_file.suffix.lower() == '.ply':
+    error = _check_geometry_file(path_str, st.st_mtime_ns, st.st_size)
+    if error is not None:
+        issue, technical_details = error
         raise GeometryFileError(
-            filename=str(geometry_file),
-            issue=f"Expected PLY file, got '{geometry_file.suffix}' file",
-            technical_details=f"File must have .ply extension and be in PLY format"
+            filename=path_str,
+            issue=issue,
+            technical_details=technical_details
         )
-    
-    # Check if file is readable and not empty
+
+    # The PLY magic is authoritative; an unusual extension is only worth a warning.
+    # It names the file, so the default once-per-location filter still reports
+    # every misnamed file, and it points at the code calling design_structure
+    if not path_str.lower().endswith('.ply'):
+        warnings.warn(
+            f"Geometry file '{path_str}' has PLY content but a "
+            f"'{os.path.splitext(path_str)[1]}' extension instead of '.ply'",
+            stacklevel=3
+        )
+
+
+@lru_cache(maxsize=128)
+def _check_geometry_file(path_str: str, mtime_ns: int, size: int) -> Optional[Tuple[str, str]]:
+    """
+    Check emptiness and PLY magic of an existing geometry file.
+
+    Returns ``(issue, technical_details)`` for an invalid file and None for a
+    valid one.  The verdict is cached per (path, mtime, size), so modifying the
+    file invalidates it; read failures raise and are therefore never cached.
+    """
     try:
-        with open(geometry_file, 'r') as f:
-            content = f.read(100)  # Read first 100 chars
-            if not content.strip():
-                raise GeometryFileError(
-                    filename=str(geometry_file),
-                    issue="File is empty",
-                    technical_details="PLY file contains no data"
-                )
-            
-            if 'ply' not in content.lower():
-                raise GeometryFileError(
-                    filename=str(geometry_file),
-                    issue="File doesn't appear to be in PLY format",
-                    technical_details=f"Expected PLY header, found: {content[:50]}..."
-                )
-                
+        fd = os.open(path_str, os.O_RDONLY)
     except PermissionError:
         raise GeometryFileError(
-            filename=str(geometry_file),
+            filename=path_str,
             issue="Permission denied",
             technical_details="Cannot read file due to permission restrictions"
         )
     except Exception as e:
         raise GeometryFileError(
-            filename=str(geometry_file),
+            filename=path_str,
             issue="Cannot read file",
             technical_details=f"Unexpected error: {str(e)}"
         )
+    try:
+        return _check_fd(fd, path_str, size)
+    finally:
+        os.close(fd)
+
+
+def _check_fd(fd: int, name: str, size: int) -> Optional[Tuple[str, str]]:
+    """Check emptiness and PLY magic of an open geometry file of ``size`` bytes."""
+    # Check if file is readable and not empty; only the header bytes are needed
+    head = b""
+    if size:
+        try:
+            head = _read_head(fd, 64)
+        except PermissionError:
+            raise GeometryFileError(
+                filename=name,
+                issue="Permission denied",
+                technical_details="Cannot read file due to permission restrictions"
+            )
+        except Exception as e:
+            raise GeometryFileError(
+                filename=name,
+                issue="Cannot read file",
+                technical_details=f"Unexpected error: {str(e)}"
+            )
+
+    if not head.strip():
+        return "File is empty", "PLY file contains no data"
+
+    if head[:3].lower() != b'ply':
+        return (
+            "File doesn't appear to be in PLY format",
+            f"Expected PLY header, found: {head[:16]!r}"
+        )
+
+    return None
+
+
+def _read_head(fd: int, count: int) -> bytes:
+    """Read the first ``count`` bytes of ``fd`` without moving its offset where possible."""
+    if hasattr(os, 'pread'):
+        return os.pread(fd, count, 0)
+    # os.pread is unavailable on Windows
+    os.lseek(fd, 0, os.SEEK_SET)
+    return os.read(fd, count)
+
+
+@lru_cache(maxsize=None)
+def _byte_tables():
+    """
+    Build the 256-entry byte lookup tables used to scan scaffold files.
+
+    Returns ``(invalid, whitespace)`` boolean arrays.  NumPy is imported here,
+    on the first file check, so importing the exceptions stays cheap.
+    """
+    import numpy as np
+
+    invalid = np.ones(256, dtype=bool)
+    invalid[[ord(c) for c in _VALID_BASES]] = False
+    whitespace = np.zeros(256, dtype=bool)
+    whitespace[list(_WHITESPACE)] = True
+    return invalid, whitespace
+
+
+def _find_invalid_bases(arr) -> List[str]:
+    """Return the distinct non-nucleotide characters in a uint8 array of UTF-8 text (uppercased, sorted)."""
+    import numpy as np
+
+    bad = _byte_tables()[0][arr]
+    if not bad.any():
+        return []
+    offenders = arr[bad]
+    if offenders.max() < 128:
+        return sorted(set(np.unique(offenders).tobytes().decode('ascii').upper()))
+    # Multi-byte characters are decoded so they are reported as characters
+    text = arr.tobytes().decode('utf-8', errors='replace')
+    return sorted(set(text.upper()) - _VALID_UPPER_BASES)
+
+
+def _count_characters(arr) -> int:
+    """Number of UTF-8 characters in a uint8 array (bytes that are not continuation bytes)."""
+    import numpy as np
+
+    return arr.size - int(np.count_nonzero((arr & 0xC0) == 0x80))
+
+
+def _strip_whitespace(arr):
+    """Return a view of a uint8 array with leading/trailing whitespace removed."""
+    import numpy as np
+
+    content = np.flatnonzero(~_byte_tables()[1][arr])
+    if not content.size:
+        return arr[:0]
+    return arr[content[0]:content[-1] + 1]
+
+
+def _scan_for_invalid_bases(buf) -> Tuple[int, List[str]]:
+    """
+    Scan a (possibly memory-mapped) byte buffer in fixed-size chunks.
+
+    Returns the number of characters in the buffer with surrounding whitespace
+    stripped and the invalid characters of the first offending chunk, so peak
+    memory stays bounded by the chunk size rather than the file size.
+    """
+    import numpy as np
+
+    start, end = 0, len(buf)
+    while start < end and buf[start] in _WHITESPACE:
+        start += 1
+    while end > start and buf[end - 1] in _WHITESPACE:
+        end -= 1
+
+    offset = start
+    while offset < end:
+        # Stop chunks on a character boundary so multi-byte characters decode
+        chunk_end = min(offset + _SCAN_CHUNK_SIZE, end)
+        while offset < chunk_end < end and buf[chunk_end] & 0xC0 == 0x80:
+            chunk_end -= 1
+        chunk = np.frombuffer(buf, dtype=np.uint8, count=chunk_end - offset, offset=offset)
+        invalid_chars = _find_invalid_bases(chunk)
+        if invalid_chars:
+            length = sum(
+                _count_characters(np.frombuffer(buf, dtype=np.uint8, offset=chunk_start,
+                                                count=min(_SCAN_CHUNK_SIZE, end - chunk_start)))
+                for chunk_start in range(start, end, _SCAN_CHUNK_SIZE)
+            )
+            return length, invalid_chars
+        offset = chunk_end
+    # Only nucleotides remain, so bytes and characters coincide
+    return end - start, []
+
+
+@lru_cache(maxsize=128)
+def _check_scaffold_file(path_str: str, mtime_ns: int, size: int) -> Optional[Tuple[str, str, str]]:
+    """
+    Check that an existing scaffold file is non-empty and holds only nucleotides.
+
+    Returns ``(issue, sequence_info, technical_details)`` for an invalid file
+    and None for a valid one, cached per (path, mtime, size).
+    """
+    import numpy as np
+
+    try:
+        if size <= _SCAN_CHUNK_SIZE:
+            # Small files (the common case) are read in one go as raw bytes
+            arr = _strip_whitespace(np.fromfile(path_str, dtype=np.uint8))
+            invalid_chars = _find_invalid_bases(arr)
+            length = _count_characters(arr) if invalid_chars else arr.size
+        else:
+            with open(path_str, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    length, invalid_chars = _scan_for_invalid_bases(mm)
+    except PermissionError:
+        raise ScaffoldSequenceError(
+            issue="Cannot read scaffold sequence file",
+            sequence_info=f"Permission denied: {path_str}"
+        )
+
+    if not length:
+        return "Scaffold sequence file is empty", f"File: {path_str}", ""
+
+    # Validate nucleotides
+    if invalid_chars:
+        return (
+            "Invalid characters in scaffold sequence",
+            f"Found: {', '.join(sorted(invalid_chars))}",
+            f"Only A, T, G, C, U are allowed. Sequence length: {length}"
+        )
+
+    return None
 
 
 def validate_scaffold_sequence(scaffold_sequence, project_name: str):
@@ -204,46 +435,36 @@ def validate_scaffold_sequence(scaffold_sequence, project_name: str):
         return  # Valid default cases
     
     if isinstance(scaffold_sequence, (str, Path)):
-        seq_path = Path(scaffold_sequence)
+        seq_str = os.fspath(scaffold_sequence)
         
-        # If it looks like a file path, validate as file
-        if '/' in str(scaffold_sequence) or '\\' in str(scaffold_sequence) or seq_path.suffix:
-            if not seq_path.exists():
-                raise ScaffoldSequenceError(
-                    issue="Scaffold sequence file not found",
-                    sequence_info=f"File: {seq_path}",
-                    technical_details=f"Attempted to read: {seq_path.absolute()}"
-                )
-            
+        # If it looks like a file path (separator or extension), validate as file
+        if '/' in seq_str or '\\' in seq_str or '.' in seq_str:
             try:
-                with open(seq_path, 'r') as f:
-                    sequence = f.read().strip()
-                    if not sequence:
-                        raise ScaffoldSequenceError(
-                            issue="Scaffold sequence file is empty",
-                            sequence_info=f"File: {seq_path}"
-                        )
-                    
-                    # Validate nucleotides
-                    valid_bases = set('ATGCU')
-                    invalid_chars = set(sequence.upper()) - valid_bases
-                    if invalid_chars:
-                        raise ScaffoldSequenceError(
-                            issue="Invalid characters in scaffold sequence",
-                            sequence_info=f"Found: {', '.join(sorted(invalid_chars))}",
-                            technical_details=f"Only A, T, G, C, U are allowed. Sequence length: {len(sequence)}"
-                        )
+                st = os.stat(seq_str)
             except PermissionError:
                 raise ScaffoldSequenceError(
                     issue="Cannot read scaffold sequence file",
-                    sequence_info=f"Permission denied: {seq_path}"
+                    sequence_info=f"Permission denied: {seq_str}"
+                )
+            except (OSError, ValueError) as e:
+                # Unusable paths (embedded NUL, symlink loops) count as missing too
+                technical_details = f"Attempted to read: {os.path.abspath(seq_str)}"
+                if not isinstance(e, (FileNotFoundError, NotADirectoryError)):
+                    technical_details += f"\nReason: {getattr(e, 'strerror', None) or e}"
+                raise ScaffoldSequenceError(
+                    issue="Scaffold sequence file not found",
+                    sequence_info=f"File: {seq_str}",
+                    technical_details=technical_details
                 )
+            
+            error = _check_scaffold_file(seq_str, st.st_mtime_ns, st.st_size)
+            if error is not None:
+                raise ScaffoldSequenceError(*error)
         else:
             # Treat as sequence string - validate nucleotides
-            sequence = str(scaffold_sequence).upper()
-            valid_bases = set('ATGCU')
-            invalid_chars = set(sequence) - valid_bases
-            if invalid_chars:
+            sequence = seq_str
+            if not _VALID_BASES.issuperset(sequence):
+                invalid_chars = set(sequence.upper()) - _VALID_UPPER_BASES
                 raise ScaffoldSequenceError(
                     issue="Invalid characters in scaffold sequence string",
                     sequence_info=f"Found: {', '.join(sorted(invalid_chars))}",
@@ -253,39 +474,34 @@ def validate_scaffold_sequence(scaffold_sequence, project_name: str):
 
 def validate_output_directory(output_dir: Optional[Path], project_name: str) -> Path:
     """Validate and create output directory with helpful error messages."""
-    if output_dir is None:
-        output_dir = Path.cwd()
-    
-    project_dir = output_dir / project_name
+    project_dir = os.path.join(
+        os.getcwd() if output_dir is None else os.fspath(output_dir), project_name
+    )
     
     try:
-        project_dir.mkdir(parents=True, exist_ok=True)
+        os.makedirs(project_dir, exist_ok=True)
     except PermissionError:
         raise OutputDirectoryError(
-            directory=str(project_dir),
+            directory=project_dir,
             issue="Permission denied - cannot create directory"
         )
     except OSError as e:
         if "No space left on device" in str(e):
             raise OutputDirectoryError(
-                directory=str(project_dir),
+                directory=project_dir,
                 issue="No space left on device"
             )
         else:
             raise OutputDirectoryError(
-                directory=str(project_dir),
+                directory=project_dir,
                 issue=f"Cannot create directory: {str(e)}"
             )
     
-    # Test write permissions
-    test_file = project_dir / ".write_test"
-    try:
-        test_file.touch()
-        test_file.unlink()
-    except PermissionError:
+    # Test write permissions (advisory; avoids creating a probe file)
+    if not os.access(project_dir, os.W_OK):
         raise OutputDirectoryError(
-            directory=str(project_dir),
+            directory=project_dir,
             issue="Directory exists but is not writable"
         )
     
-    return project_dir
\ No newline at end of file
+    return Path(project_dir)
\ No newline at end of file
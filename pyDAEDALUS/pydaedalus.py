@@ -6,13 +6,13 @@ from 3D geometric inputs (PLY files).
 """
 
 import os
-from math import floor
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
-from typing import Optional, Union, Tuple
+from typing import List, Optional, Union, Tuple
 
-from Automated_Design.ply_to_input import ply_to_input
-from Automated_Design.DX_cage_design import DX_cage_design
-from Automated_Design.gen_PDB import pdbgen
 try:
     from .exceptions import (
         PyDAEDALUSError, GeometryFileError, ScaffoldSequenceError, 
@@ -29,30 +29,108 @@ except ImportError:
     )
 
 
+# Helical form -> (A-form geometry, twist mode, half-bp per helical turn, minimum turns);
+# half-bp keeps B-form's 10.5 bp/turn an integer
+_HELICAL_TABLE = {
+    "Aform": (True, 1, 22, 4),
+    "Bform": (False, 1, 21, 3),
+    "Hybrid": (True, 2, 22, 4),
+    "Twisted": (True, 3, 22, 4),
+}
+_VALID_FORMS = frozenset(_HELICAL_TABLE)
+_VALID_FORMS_TEXT = ", ".join(sorted(_VALID_FORMS))
+
+# Defaults of design_structure, also applied to specs passed to design_structures
+_DEFAULT_HELICAL_FORM = "Bform"
+_DEFAULT_HELICAL_TURNS = 4
+
+# Bytes removed from scaffold sequence files before use
+_SCAFFOLD_WHITESPACE = b" \t\r\n"
+
+# Scaffold strings longer than a path can be, starting with these characters,
+# are taken as literal sequences without touching the filesystem
+_MAX_PATH_LENGTH = 260
+_SEQUENCE_CHARS = frozenset("ACGTUacgtu\n\r \t")
+
+# Words in DX_cage_design error messages that identify the failing stage
+_DESIGN_ERROR_KEYWORDS = re.compile(r"scaffold|short|length|staple|routing|path", re.IGNORECASE)
+
+# Background threads for PDB files requested with defer_pdb=True, created on
+# first use
+_PDB_POOL = None
+
+# Deferred PDB jobs still running, by project directory. pdbgen reads the
+# .cndo file and appends to the PDB outputs, so a new design into the same
+# directory waits for them before writing anything.
+_PENDING_PDB = {}
+_PENDING_PDB_LOCK = threading.Lock()
+
+
+def _reset_pdb_state() -> None:
+    """Forget the parent's PDB pool and jobs in a forked child."""
+    # The child inherits the pool's bookkeeping but none of its threads, so
+    # jobs submitted to it would never run
+    global _PDB_POOL, _PENDING_PDB, _PENDING_PDB_LOCK
+    _PDB_POOL = None
+    _PENDING_PDB = {}
+    _PENDING_PDB_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pdb_state)
+
+
 class DesignResult:
     """Container for design results and output files."""
     
-    def __init__(self, project_name: str, output_dir: str, full_file_name: str):
+    def __init__(self, project_name: str, output_dir: str, full_file_name: str,
+                 pdb_ready: Optional[Future] = None):
         self.project_name = project_name
         self.output_dir = Path(output_dir)
         self.full_file_name = full_file_name
+        # Set when PDB generation was deferred to a background thread
+        self.pdb_ready = pdb_ready
         
-    @property
+    def __getstate__(self):
+        # A future cannot be pickled; wait for the PDB and send its outcome
+        state = self.__dict__.copy()
+        if self.pdb_ready is not None:
+            state["pdb_ready"] = (self.pdb_ready.exception(),)
+        return state
+    
+    def __setstate__(self, state):
+        if state.get("pdb_ready") is not None:
+            pdb_ready = Future()
+            error, = state["pdb_ready"]
+            if error is None:
+                pdb_ready.set_result(None)
+            else:
+                pdb_ready.set_exception(error)
+            state["pdb_ready"] = pdb_ready
+        self.__dict__.update(state)
+
+    @cached_property
     def csv_file(self) -> Path:
         """Path to staple sequences CSV file."""
         return self.output_dir / f"staples_{self.full_file_name}.csv"
     
-    @property
+    @cached_property
     def cndo_file(self) -> Path:
         """Path to CanDo structure file."""
         return self.output_dir / f"{self.full_file_name}.cndo"
     
-    @property
+    @cached_property
     def pdb_file(self) -> Path:
-        """Path to PDB atomic model file."""
+        """
+        Path to PDB atomic model file.
+
+        Waits for deferred generation and re-raises the error if it failed.
+        """
+        if self.pdb_ready is not None:
+            self.pdb_ready.result()
         return self.output_dir / f"{self.full_file_name}.pdb"
     
-    @property
+    @cached_property
     def plot_file(self) -> Path:
         """Path to 3D visualization plot."""
         return self.output_dir / f"{self.full_file_name}.png"
@@ -61,12 +139,13 @@ class DesignResult:
 def design_structure(
     project_name: str,
     geometry_file: Union[str, Path],
-    helical_form: str = "Bform",
-    helical_turns: int = 4,
+    helical_form: str = _DEFAULT_HELICAL_FORM,
+    helical_turns: int = _DEFAULT_HELICAL_TURNS,
     scaffold_sequence: Optional[Union[str, Path]] = None,
     output_dir: Optional[Union[str, Path]] = None,
     single_crossovers: bool = False,
-    print_output: bool = True
+    print_output: bool = True,
+    defer_pdb: bool = False
 ) -> DesignResult:
     """
     Design a nucleic acid-scaffolded wireframe origami structure.
@@ -95,6 +174,12 @@ def design_structure(
         double crossover vertex staples (False)
     print_output : bool, default True
         Whether to print progress information
+    defer_pdb : bool, default False
+        Generate the PDB model on a background thread and return as soon as
+        the CSV and CanDo files are written. `DesignResult.pdb_file` waits
+        for it to finish and raises if it failed. A later design into the
+        same project directory also waits for it; designing into one project
+        directory from several threads at once is not supported.
         
     Returns
     -------
@@ -116,46 +201,36 @@ def design_structure(
     """
     
     # Comprehensive input validation with detailed error messages
-    geometry_file = Path(geometry_file)
+    if not isinstance(geometry_file, Path):
+        geometry_file = Path(geometry_file)
     validate_geometry_file(geometry_file)
-    
-    valid_forms = {"Aform", "Bform", "Hybrid", "Twisted"}
-    if helical_form not in valid_forms:
-        suggestions = [
-            f"Use one of the valid helical forms: {', '.join(sorted(valid_forms))}",
-            "For DNA structures, use 'Bform'", 
-            "For RNA structures, use 'Aform'",
-            "For advanced users: 'Hybrid' and 'Twisted' are A-form variants"
-        ]
-        raise PyDAEDALUSError(
-            f"Invalid helical_form '{helical_form}'",
-            f"Valid options are: {', '.join(sorted(valid_forms))}",
-            suggestions
-        )
-    
-    # Set minimum edge length requirements
-    min_turns = {"Aform": 4, "Bform": 3, "Hybrid": 4, "Twisted": 4}
-    if helical_turns < min_turns[helical_form]:
-        raise HelicalParameterError(helical_form, helical_turns, min_turns[helical_form])
-    
+    ply_header = _quick_ply_header_check(geometry_file)
+    _validate_helical_parameters(helical_form, helical_turns)
+
     # Validate scaffold sequence
     validate_scaffold_sequence(scaffold_sequence, project_name)
     
     # Set up and validate output directory
-    if output_dir is not None:
-        output_dir = Path(output_dir)
     project_dir = validate_output_directory(output_dir, project_name)
+    project_dir_str = os.fspath(project_dir)
+    _wait_for_pending_pdb(project_dir_str)
     
     # Configure helical parameters
     helical_config = _get_helical_config(helical_form, helical_turns)
     
+    # The design pipeline pulls in NumPy, SciPy, matplotlib and networkx, so it
+    # is imported on first use rather than with this module
+    from Automated_Design.ply_to_input import ply_to_input
+    from Automated_Design.DX_cage_design import DX_cage_design
+
     # Process geometry file with error handling
     try:
         coordinates, edges, faces, edge_length_vec, file_name, staple_name, singleXOs = ply_to_input(
-            str(geometry_file), 
-            str(project_dir), 
+            os.fspath(geometry_file), 
+            project_dir_str, 
             helical_config["min_edge_len"], 
-            helical_config["h_form"]
+            helical_config["h_form"],
+            header=(ply_header["format"], ply_header["elements"], ply_header["body_offset"])
         )
     except AssertionError as e:
         raise GeometryFileError(
@@ -199,7 +274,7 @@ def design_structure(
         )
         
         # Validate scaffold length if provided
-        if scaf_seq and len(scaf_seq) < min_scaffold_length:
+        if scaf_seq is not None and len(scaf_seq) < min_scaffold_length:
             raise ScaffoldSequenceError(
                 issue="Scaffold sequence too short",
                 sequence_info=f"Provided: {len(scaf_seq)} nt, Required: ≥{min_scaffold_length} nt",
@@ -231,26 +306,26 @@ def design_structure(
             scaf_seq=scaf_seq,
             scaf_name=scaf_name,
             Aform=helical_config["h_form"],
-            results_foldername=str(project_dir),
+            results_foldername=project_dir_str,
             twist=helical_config["twist"],
             print_to_console=print_output
         )
     except Exception as e:
         # Analyze the error and provide specific guidance
-        error_str = str(e).lower()
+        keywords = _design_error_keywords(str(e))
         
-        if "scaffold" in error_str and ("short" in error_str or "length" in error_str):
+        if "scaffold" in keywords and ("short" in keywords or "length" in keywords):
             raise ScaffoldSequenceError(
                 issue="Scaffold too short during design",
-                sequence_info=f"Current scaffold: {len(scaf_seq) if scaf_seq else 'default'} nt",
+                sequence_info=f"Current scaffold: {len(scaf_seq) if scaf_seq is not None else 'default'} nt",
                 technical_details=f"Design algorithm error: {str(e)}"
             )
-        elif "staple" in error_str:
+        elif "staple" in keywords:
             raise StapleGenerationError(
                 stage="Staple sequence assignment",
                 technical_details=f"Error during staple generation: {str(e)}"
             )
-        elif "routing" in error_str or "path" in error_str:
+        elif "routing" in keywords or "path" in keywords:
             raise DesignConstraintError(
                 constraint="Scaffold routing failed",
                 geometry_info=f"Edges: {num_edges}, Form: {helical_form}",
@@ -263,72 +338,263 @@ def design_structure(
                 technical_details=f"Unexpected error in DX_cage_design: {str(e)}"
             )
     
-    # Generate PDB file with error handling
-    try:
-        pdbgen(full_file_name, helical_config["h_form"], str(project_dir))
-    except Exception as e:
-        # PDB generation failure shouldn't stop the whole process
-        if print_output:
-            print(f"Warning: PDB file generation failed: {e}")
-            print("Other output files (CSV, CanDo) were generated successfully.")
+    # Generate PDB file, in the background if the caller asked to defer it
+    pdb_args = (full_file_name, helical_config["h_form"], project_dir_str)
+    pdb_ready = None
+    if defer_pdb:
+        pdb_ready = _submit_pdb(*pdb_args)
+    else:
+        try:
+            _generate_pdb(*pdb_args)
+        except Exception as e:
+            # PDB generation failure shouldn't stop the whole process
+            if print_output:
+                print(f"Warning: PDB file generation failed: {e}")
+                print("Other output files (CSV, CanDo) were generated successfully.")
     
-    return DesignResult(project_name, str(project_dir), full_file_name)
+    return DesignResult(project_name, project_dir_str, full_file_name, pdb_ready)
+
+
+def _generate_pdb(full_file_name: str, h_form: bool, project_dir: str) -> None:
+    """Write the PDB model for a finished design."""
+    from Automated_Design.gen_PDB import pdbgen
+
+    pdbgen(full_file_name, h_form, project_dir)
+
+
+def _submit_pdb(full_file_name: str, h_form: bool, project_dir: str) -> Future:
+    """Queue `_generate_pdb` on the background pool and track it by project directory."""
+    global _PDB_POOL
+    with _PENDING_PDB_LOCK:
+        if _PDB_POOL is None:
+            _PDB_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pydaedalus-pdb")
+        future = _PDB_POOL.submit(_generate_pdb, full_file_name, h_form, project_dir)
+        _PENDING_PDB[project_dir] = future
+    future.add_done_callback(partial(_forget_pdb, project_dir))
+    return future
+
+
+def _forget_pdb(project_dir: str, future: Future) -> None:
+    """Drop a finished PDB job from the pending table."""
+    with _PENDING_PDB_LOCK:
+        if _PENDING_PDB.get(project_dir) is future:
+            del _PENDING_PDB[project_dir]
+
+
+def _wait_for_pending_pdb(project_dir: str) -> None:
+    """Block until a deferred PDB job writing into ``project_dir`` has finished."""
+    with _PENDING_PDB_LOCK:
+        pending = _PENDING_PDB.get(project_dir)
+    if pending is not None:
+        # Its outcome belongs to the earlier DesignResult, so don't raise it here
+        wait([pending])
+
+
+def design_structures(specs: List[dict], max_workers: Optional[int] = None) -> List[DesignResult]:
+    """
+    Design several structures in parallel worker processes.
+
+    Each design must write into its own project directory (``output_dir``
+    joined with ``project_name``), since parallel designs into one directory
+    would overwrite each other's files.
+
+    Parameters
+    ----------
+    specs : list of dict
+        Keyword arguments for `design_structure`, one dict per design.
+        ``defer_pdb`` is ignored: each worker writes its PDB before returning.
+    max_workers : int, optional
+        Number of worker processes. If None, uses the number of CPUs.
+
+    Returns
+    -------
+    list of DesignResult
+        Results in the same order as `specs`
+
+    Raises
+    ------
+    PyDAEDALUSError
+        If two specs share a project directory, or else the first error
+        raised by any design, in input order
+
+    Examples
+    --------
+    >>> results = design_structures([
+    ...     {"project_name": "tet", "geometry_file": "tetrahedron.ply"},
+    ...     {"project_name": "cube", "geometry_file": "cube.ply", "helical_turns": 5},
+    ... ])
+    """
+    # Check each distinct helical setting once, before any worker starts
+    for helical_form, helical_turns in {
+        (spec.get("helical_form", _DEFAULT_HELICAL_FORM),
+         spec.get("helical_turns", _DEFAULT_HELICAL_TURNS))
+        for spec in specs
+    }:
+        _validate_helical_parameters(helical_form, helical_turns)
+
+    # Workers in separate processes cannot wait for one another, so refuse specs
+    # sharing a project directory (joined as in validate_output_directory)
+    spec_by_dir = {}
+    for index, spec in enumerate(specs):
+        output_dir = spec.get("output_dir")
+        project_dir = os.path.normcase(os.path.realpath(os.path.join(
+            os.getcwd() if output_dir is None else os.fspath(output_dir),
+            spec.get("project_name", "")
+        )))
+        if project_dir in spec_by_dir:
+            raise PyDAEDALUSError(
+                "Two designs write into the same project directory",
+                f"Specs {spec_by_dir[project_dir]} and {index} both use: {project_dir}",
+                [
+                    "Give each design its own project_name or output_dir",
+                    "Call design_structure in turn to redesign into one directory"
+                ]
+            )
+        spec_by_dir[project_dir] = index
+
+    # Imported here since it pulls in multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_design_from_spec, specs))
+
+
+def _design_from_spec(spec: dict) -> DesignResult:
+    """Worker entry point for `design_structures`."""
+    # The result is pickled back to the parent, which waits for the PDB anyway
+    return design_structure(**{**spec, "defer_pdb": False})
+
+
+def _validate_helical_parameters(helical_form: str, helical_turns: int) -> None:
+    """Check the helical form name and the minimum turns it requires."""
+    if helical_form not in _VALID_FORMS:
+        suggestions = [
+            f"Use one of the valid helical forms: {_VALID_FORMS_TEXT}",
+            "For DNA structures, use 'Bform'",
+            "For RNA structures, use 'Aform'",
+            "For advanced users: 'Hybrid' and 'Twisted' are A-form variants"
+        ]
+        raise PyDAEDALUSError(
+            f"Invalid helical_form '{helical_form}'",
+            f"Valid options are: {_VALID_FORMS_TEXT}",
+            suggestions
+        )
+
+    # Set minimum edge length requirements
+    min_turns = _HELICAL_TABLE[helical_form][3]
+    if helical_turns < min_turns:
+        raise HelicalParameterError(helical_form, helical_turns, min_turns)
+
+
+def _design_error_keywords(message: str) -> set:
+    """Lowercased stage keywords found in a design error message."""
+    return {keyword.lower() for keyword in _DESIGN_ERROR_KEYWORDS.findall(message)}
+
+
+def _quick_ply_header_check(geometry_file: Path) -> dict:
+    """
+    Read just the PLY header and check it describes vertices and faces.
+
+    Returns the format, the vertex and face counts, and the parsed elements
+    with the body offset so `ply_to_input` can skip the header.
+    """
+    st = os.stat(geometry_file)
+    return _read_ply_header_info(os.fspath(geometry_file), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=256)
+def _read_ply_header_info(geometry_file: str, mtime_ns: int, size: int) -> dict:
+    # Keyed on mtime and size so an edited file is read again; errors are raised
+    # and therefore never cached
+    from Automated_Design.ply_to_input import PLY_BYTE_ORDER, read_ply_header
+
+    try:
+        with open(geometry_file, "rb") as f:
+            ply_format, elements = read_ply_header(f)
+            body_offset = f.tell()
+    except (AssertionError, ValueError, IndexError) as e:
+        raise GeometryFileError(
+            filename=geometry_file,
+            issue="Malformed PLY header",
+            technical_details=str(e) or "PLY header could not be parsed"
+        )
+
+    if ply_format != "ascii" and ply_format not in PLY_BYTE_ORDER:
+        raise GeometryFileError(
+            filename=geometry_file,
+            issue="Unsupported PLY format",
+            technical_details=f"Expected ascii or binary, found: {ply_format!r}"
+        )
+
+    element_names = [name for name, _, _ in elements[:2]]
+    if element_names != ["vertex", "face"]:
+        raise GeometryFileError(
+            filename=geometry_file,
+            issue="PLY file must list vertex then face elements",
+            technical_details=f"Found elements: {', '.join(element_names) or 'none'}"
+        )
+
+    return {
+        "format": ply_format,
+        "n_verts": elements[0][1],
+        "n_faces": elements[1][1],
+        "elements": elements,
+        "body_offset": body_offset,
+    }
 
 
 def _get_helical_config(helical_form: str, helical_turns: int) -> dict:
     """Get helical configuration parameters."""
-    if helical_form == 'Aform':
-        return {
-            "min_edge_len": helical_turns * 11,
-            "h_form": True,
-            "twist": 1
-        }
-    elif helical_form == 'Bform':
-        return {
-            "min_edge_len": floor(helical_turns * 10.5),
-            "h_form": False, 
-            "twist": 1
-        }
-    elif helical_form == 'Hybrid':
-        return {
-            "min_edge_len": helical_turns * 11,
-            "h_form": True,
-            "twist": 2
-        }
-    elif helical_form == 'Twisted':
-        return {
-            "min_edge_len": helical_turns * 11,
-            "h_form": True,
-            "twist": 3
-        }
+    h_form, twist, half_bp_per_turn, _ = _HELICAL_TABLE[helical_form]
+    return {
+        "min_edge_len": (helical_turns * half_bp_per_turn) // 2,
+        "h_form": h_form,
+        "twist": twist
+    }
+
+
+def _uppercase(sequence):
+    """Uppercase a str or bytes sequence, reusing it when it already is."""
+    return sequence if sequence.isupper() else sequence.upper()
 
 
 def _process_scaffold_sequence(
     scaffold_sequence: Optional[Union[str, Path]], 
     project_name: str,
     edge_length_vec
-) -> Tuple[str, str]:
+) -> Tuple[Optional[str], Optional[str]]:
     """Process scaffold sequence input."""
     if scaffold_sequence is None or scaffold_sequence == "M13.txt":
         # Use default M13 or random sequence
-        return [], []
+        return None, None
+    
+    # Long strings made of nucleotides are sequences, not paths; skip the stat
+    if (isinstance(scaffold_sequence, str)
+            and len(scaffold_sequence) > _MAX_PATH_LENGTH
+            and _SEQUENCE_CHARS.issuperset(scaffold_sequence[:64])):
+        return _uppercase(scaffold_sequence), project_name
     
     # Check if it's a file path or sequence string
     if isinstance(scaffold_sequence, (str, Path)):
         scaffold_path = Path(scaffold_sequence)
         if scaffold_path.exists():
-            # Read from file
-            with open(scaffold_path, 'r') as f:
-                scaf_seq = ''.join(line.strip() for line in f).upper()
+            # Read from file without a file object, dropping line breaks and
+            # padding in one C-level pass
+            fd = os.open(scaffold_path, os.O_RDONLY)
+            try:
+                raw = os.read(fd, os.fstat(fd).st_size)
+            finally:
+                os.close(fd)
+            scaf_seq = _uppercase(raw.translate(None, _SCAFFOLD_WHITESPACE)).decode('ascii')
             scaf_name = project_name
             return scaf_seq, scaf_name
         else:
             # Treat as sequence string
-            scaf_seq = str(scaffold_sequence).upper()
+            scaf_seq = _uppercase(str(scaffold_sequence))
             scaf_name = project_name
             return scaf_seq, scaf_name
     
-    return [], []
+    return None, None
 
 
 # Convenience aliases for common use cases